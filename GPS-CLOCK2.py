@@ -6,7 +6,7 @@ It offers both digital and analog clock modes, and supports various time zones,
 
 Features:
 - Digital and analog clock display modes
-- Real-time time updates based on GPS data
+- Real-time time updates based on GPS data, read as soon as each sentence arrives
 - Time zone selection menu
 - Fullscreen mode with option to exit
 
@@ -19,12 +19,8 @@ Usage:
 
 Dependencies:
 - tkinter for GUI
-- serial for serial communication
-- pynmea2 for parsing NMEA sentences
-- serial.tools.list_ports for listing available serial ports
+- gpsclock_core for serial reading, NMEA parsing, time zones and configuration (see that module for its dependencies)
 - datetime for handling date and time
-- pytz for timezone handling
-- configparser for configuration file management
 - math for trigonometric calculations in analog clock
 
 Author: Adam Figueroa - CHAT-GPT4o
@@ -32,88 +28,57 @@ Date: 06/08/2024
 """
 
 import tkinter as tk
-import serial
-import pynmea2
-import serial.tools.list_ports
 from datetime import datetime
-import pytz
-import configparser
 import math
+from gpsclock_core import LEDClockBase, run
+
+# cos/sin of each minute position on the dial, starting at 1 minute past 12
+_TICK = tuple((math.cos(math.radians(i * 6 - 90)), math.sin(math.radians(i * 6 - 90))) for i in range(1, 61))
+
+class LEDClockApplication(LEDClockBase):
+    # US time zones followed by the top ten global time zones
+    TIME_ZONES = [
+        'US/Eastern', 'US/Central', 'US/Mountain', 'US/Pacific',
+        'US/Alaska', 'US/Hawaii', 'US/Aleutian', 'US/Arizona',
+        'US/East-Indiana', 'US/Indiana-Starke', 'US/Michigan',
+        'US/Samoa', 'US/Guam',
+        'UTC', 'Europe/London', 'Europe/Paris', 'Asia/Tokyo', 'Asia/Hong_Kong',
+        'Australia/Sydney', 'Europe/Moscow', 'Asia/Dubai', 'Asia/Singapore',
+        'Europe/Berlin', 'Europe/Rome'
+    ]
 
-class LEDClockApplication(tk.Frame):
     def __init__(self, master=None, port=None, baudrate=9600):
-        super().__init__(master)
-        self.master = master
-        self.port = port
-        self.baudrate = baudrate
         self.fullscreen = False
-        self.load_config()
-        self.configure_gui()
-        self.create_widgets()
-        self.create_menu()
-        self.ser = serial.Serial(port, baudrate)
-        self.update_time()
+        self._static_built = False
         self.clock_mode = 'digital'
+        super().__init__(master, port, baudrate)
 
         self.master.bind("<Control-q>", self.exit_fullscreen)
         self.master.bind("<Control-f>", self.toggle_fullscreen)
 
-    def load_config(self):
-        self.config = configparser.ConfigParser()
-        self.config.read('config.ini')
-        self.selected_time_zone = self.config.get('Settings', 'TimeZone', fallback='UTC')
-
-    def save_config(self):
-        if not self.config.has_section('Settings'):
-            self.config.add_section('Settings')
-        self.config.set('Settings', 'TimeZone', self.selected_time_zone)
-        with open('config.ini', 'w') as configfile:
-            self.config.write(configfile)
-
     def configure_gui(self):
-        self.master.title("GPS LED Clock")
-        self.master.configure(background='black')
+        super().configure_gui()
         self.pack(fill=tk.BOTH, expand=1)
 
     def create_widgets(self):
-        self.time_label = tk.Label(self, font=("Courier", 48, "bold"), fg="#00FF00", bg="black")
+        super().create_widgets()
         self.time_label.pack(expand=1, fill=tk.BOTH)
         self.canvas = tk.Canvas(self, bg='black')
         self.canvas.pack(fill=tk.BOTH, expand=1)
         self.canvas.pack_forget()
+        self.canvas.bind("<Configure>", self.invalidate_clock_face)
+        # Clock hands are created once; draw_analog_clock only moves them
+        self._hour_id = self.canvas.create_line(0, 0, 0, 0, fill="#00FF00", width=4, tags="hand")
+        self._minute_id = self.canvas.create_line(0, 0, 0, 0, fill="#00FF00", width=2, tags="hand")
+        self._second_id = self.canvas.create_line(0, 0, 0, 0, fill="#FF0000", width=1, tags="hand")
 
     def create_menu(self):
-        self.menu_bar = tk.Menu(self.master)
-        self.master.config(menu=self.menu_bar)
-
-        self.time_zone_menu = tk.Menu(self.menu_bar, tearoff=0)
-        self.menu_bar.add_cascade(label="Time Zone", menu=self.time_zone_menu)
-
+        super().create_menu()
         self.clock_mode_menu = tk.Menu(self.menu_bar, tearoff=0)
         self.menu_bar.add_cascade(label="Clock Mode", menu=self.clock_mode_menu)
         self.clock_mode_menu.add_command(label="Digital", command=lambda: self.set_clock_mode('digital'))
         self.clock_mode_menu.add_command(label="Analog", command=lambda: self.set_clock_mode('analog'))
 
-        # US time zones
-        us_time_zones = [
-            'US/Eastern', 'US/Central', 'US/Mountain', 'US/Pacific',
-            'US/Alaska', 'US/Hawaii', 'US/Aleutian', 'US/Arizona',
-            'US/East-Indiana', 'US/Indiana-Starke', 'US/Michigan',
-            'US/Samoa', 'US/Guam'
-        ]
-
-        # Top ten global time zones
-        global_time_zones = [
-            'UTC', 'Europe/London', 'Europe/Paris', 'Asia/Tokyo', 'Asia/Hong_Kong',
-            'Australia/Sydney', 'Europe/Moscow', 'Asia/Dubai', 'Asia/Singapore',
-            'Europe/Berlin', 'Europe/Rome'
-        ]
-
-        time_zones = us_time_zones + global_time_zones
-
-        for tz in time_zones:
-            self.time_zone_menu.add_command(label=tz, command=lambda tz=tz: self.set_time_zone(tz))
-
     def set_clock_mode(self, mode):
         self.clock_mode = mode
         if mode == 'digital':
@@ -122,60 +87,66 @@ class LEDClockApplication(tk.Frame):
         else:
             self.time_label.pack_forget()
             self.canvas.pack(fill=tk.BOTH, expand=1)
-        self.update_time()
-
-    def set_time_zone(self, tz):
-        self.selected_time_zone = tz
-        self.save_config()
-
-    def update_time(self):
-        while self.ser.in_waiting:
-            try:
-                line = self.ser.readline().decode('ascii', 'ignore').rstrip()
-                msg = pynmea2.parse(line)
-                if isinstance(msg, pynmea2.types.talker.RMC) and msg.timestamp and msg.datestamp:
-                    datetime_obj = datetime.combine(msg.datestamp, msg.timestamp)
-                    timezone = pytz.timezone(self.selected_time_zone)
-                    datetime_obj = datetime_obj.replace(tzinfo=pytz.UTC).astimezone(timezone)
-                    if self.clock_mode == 'digital':
-                        self.time_label["text"] = datetime_obj.strftime('%Y-%m-%d\n%H:%M:%S')
-                    else:
-                        self.draw_analog_clock(datetime_obj)
-                    break
-            except pynmea2.ParseError:
-                print(f"Parse error with line: {line}")
-            except UnicodeDecodeError:
-                print("Failed to decode line, ignoring.")
-        self.master.after(1000, self.update_time)
+        self.master.update_idletasks()
+        self._render_last()
 
-    def draw_analog_clock(self, datetime_obj):
-        self.canvas.delete("all")
+    def render_time(self, datetime_obj):
+        if self.clock_mode == 'digital':
+            super().render_time(datetime_obj)
+        else:
+            self.draw_analog_clock(datetime_obj)
+
+    def show_no_gps(self):
+        super().show_no_gps()
+        # Fold the hands away and say why the analog clock stopped
+        for hand_id in (self._hour_id, self._minute_id, self._second_id):
+            self.canvas.coords(hand_id, 0, 0, 0, 0)
+        self.canvas.delete("status")
+        self.canvas.create_text(self.canvas.winfo_width() // 2, self.canvas.winfo_height() // 2,
+                                text="NO GPS", fill="#FF0000", font=("Courier", 24, "bold"), tags="status")
+
+    def build_clock_face(self):
+        self.canvas.delete("face")
         width = self.canvas.winfo_width()
         height = self.canvas.winfo_height()
         center_x = width // 2
         center_y = height // 2
         radius = min(center_x, center_y) - 10
+        self._center = (center_x, center_y)
+        self._radius = radius
 
         # Draw clock face
-        self.canvas.create_oval(center_x - radius, center_y - radius, center_x + radius, center_y + radius, outline="#00FF00", width=2)
+        self.canvas.create_oval(center_x - radius, center_y - radius, center_x + radius, center_y + radius, outline="#00FF00", width=2, tags="face")
 
         # Draw clock numbers and tick marks
-        for i in range(1, 61):
-            angle = math.radians((i * 6) - 90)
-            x_start = center_x + radius * math.cos(angle)
-            y_start = center_y + radius * math.sin(angle)
+        for i, (cos_a, sin_a) in enumerate(_TICK, start=1):
+            x_start = center_x + radius * cos_a
+            y_start = center_y + radius * sin_a
             if i % 5 == 0:
-                x_end = center_x + (radius * 0.85) * math.cos(angle)
-                y_end = center_y + (radius * 0.85) * math.sin(angle)
-                self.canvas.create_text(center_x + (radius * 0.75) * math.cos(angle),
-                                        center_y + (radius * 0.75) * math.sin(angle),
-                                        text=str(i // 5 if i // 5 != 0 else 12), fill="#00FF00", font=("Courier", 14))
+                x_end = center_x + (radius * 0.85) * cos_a
+                y_end = center_y + (radius * 0.85) * sin_a
+                self.canvas.create_text(center_x + (radius * 0.75) * cos_a,
+                                        center_y + (radius * 0.75) * sin_a,
+                                        text=str(i // 5 if i // 5 != 0 else 12), fill="#00FF00", font=("Courier", 14), tags="face")
             else:
-                x_end = center_x + (radius * 0.95) * math.cos(angle)
-                y_end = center_y + (radius * 0.95) * math.sin(angle)
-            self.canvas.create_line(x_start, y_start, x_end, y_end, fill="#00FF00", width=2 if i % 5 == 0 else 1)
+                x_end = center_x + (radius * 0.95) * cos_a
+                y_end = center_y + (radius * 0.95) * sin_a
+            self.canvas.create_line(x_start, y_start, x_end, y_end, fill="#00FF00", width=2 if i % 5 == 0 else 1, tags="face")
+
+        # Keep the persistent hands drawn over the rebuilt face
+        self.canvas.tag_raise("hand")
+        self._static_built = True
+
+    def invalidate_clock_face(self, event=None):
+        self._static_built = False
+
+    def draw_analog_clock(self, datetime_obj):
+        if not self._static_built:
+            self.build_clock_face()
+        center_x, center_y = self._center
+        radius = self._radius
 
-        # Draw hour, minute, and second hands
+        # Move hour, minute, and second hands
         hours = datetime_obj.hour % 12
         minutes = datetime_obj.minute
         seconds = datetime_obj.second
@@ -188,12 +159,12 @@ class LEDClockApplication(tk.Frame):
         minute_hand_length = radius * 0.75
         second_hand_length = radius * 0.9
 
-        self.canvas.create_line(center_x, center_y, center_x + hour_hand_length * math.cos(hour_angle),
-                                center_y + hour_hand_length * math.sin(hour_angle), fill="#00FF00", width=4)
-        self.canvas.create_line(center_x, center_y, center_x + minute_hand_length * math.cos(minute_angle),
-                                center_y + minute_hand_length * math.sin(minute_angle), fill="#00FF00", width=2)
-        self.canvas.create_line(center_x, center_y, center_x + second_hand_length * math.cos(second_angle),
-                                center_y + second_hand_length * math.sin(second_angle), fill="#FF0000", width=1)
+        self.canvas.coords(self._hour_id, center_x, center_y, center_x + hour_hand_length * math.cos(hour_angle),
+                           center_y + hour_hand_length * math.sin(hour_angle))
+        self.canvas.coords(self._minute_id, center_x, center_y, center_x + minute_hand_length * math.cos(minute_angle),
+                           center_y + minute_hand_length * math.sin(minute_angle))
+        self.canvas.coords(self._second_id, center_x, center_y, center_x + second_hand_length * math.cos(second_angle),
+                           center_y + second_hand_length * math.sin(second_angle))
 
     def toggle_fullscreen(self, event=None):
         self.fullscreen = not self.fullscreen
@@ -209,21 +180,12 @@ class LEDClockApplication(tk.Frame):
         self.master.update_idletasks()
         if self.clock_mode == 'analog':
             self.canvas.config(width=self.master.winfo_width(), height=self.master.winfo_height())
-            self.draw_analog_clock(datetime.now(pytz.timezone(self.selected_time_zone)))
+            self.draw_analog_clock(datetime.now(self._tz))
         elif self.clock_mode == 'digital':
             self.time_label.config(width=self.master.winfo_width(), height=self.master.winfo_height())
 
 def main():
-    print("Available ports:")
-    ports = serial.tools.list_ports.comports()
-    for i, port in enumerate(ports, start=1):
-        print(f"{i}: {port.device}")
-    port_index = int(input("Select the port number: ")) - 1
-    port = ports[port_index].device
-    baudrate = int(input("Enter the baudrate: "))
-    root = tk.Tk()
-    app = LEDClockApplication(master=root, port=port, baudrate=baudrate)
-    app.mainloop()
+    run(LEDClockApplication)
 
 if __name__ == "__main__":
     main()
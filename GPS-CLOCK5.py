@@ -3,9 +3,14 @@ import serial
 import pynmea2
 import serial.tools.list_ports
 from datetime import datetime
-import pytz
+from zoneinfo import ZoneInfo
 import configparser
 import math
+import logging
+
+log = logging.getLogger(__name__)
+
+UTC = ZoneInfo("UTC")
 
 class LEDClockApplication(tk.Frame):
     def __init__(self, master=None, port=None, baudrate=9600):
@@ -96,7 +101,6 @@ class LEDClockApplication(tk.Frame):
         else:
             self.time_label.pack_forget()
             self.canvas.pack(fill=tk.BOTH, expand=1)
-        self.update_time()
 
     def set_time_zone(self, tz):
         self.selected_time_zone = tz
@@ -108,9 +112,8 @@ class LEDClockApplication(tk.Frame):
                 line = self.ser.readline().decode('ascii', 'ignore').rstrip()
                 msg = pynmea2.parse(line)
                 if isinstance(msg, pynmea2.types.talker.RMC) and msg.timestamp and msg.datestamp:
-                    datetime_obj = datetime.combine(msg.datestamp, msg.timestamp)
-                    timezone = pytz.timezone(self.selected_time_zone)
-                    datetime_obj = datetime_obj.replace(tzinfo=pytz.UTC).astimezone(timezone)
+                    timezone = ZoneInfo(self.selected_time_zone)
+                    datetime_obj = datetime.combine(msg.datestamp, msg.timestamp, tzinfo=UTC).astimezone(timezone)
                     if self.clock_mode == 'digital':
                         self.time_label["text"] = datetime_obj.strftime('%Y-%m-%d\n%H:%M:%S')
                     else:
@@ -129,9 +132,9 @@ class LEDClockApplication(tk.Frame):
                         tracking = "Unknown"
                     self.sats_info = f"Sats = {num_sats} Tracking = {tracking}"
             except pynmea2.ParseError:
-                print(f"Parse error with line: {line}")
+                log.debug("parse error: %s", line)
             except UnicodeDecodeError:
-                print("Failed to decode line, ignoring.")
+                log.debug("failed to decode line, ignoring")
         self.sats_label["text"] = self.sats_info
         self.master.after(1000, self.update_time)
 
@@ -199,7 +202,7 @@ class LEDClockApplication(tk.Frame):
         self.master.update_idletasks()
         if self.clock_mode == 'analog':
             self.canvas.config(width=self.master.winfo_width(), height=self.master.winfo_height())
-            self.draw_analog_clock(datetime.now(pytz.timezone(self.selected_time_zone)))
+            self.draw_analog_clock(datetime.now(ZoneInfo(self.selected_time_zone)))
         elif self.clock_mode == 'digital':
             self.time_label.config(width=self.master.winfo_width(), height=self.master.winfo_height())
 
@@ -254,6 +257,7 @@ class LEDClockApplication(tk.Frame):
         type_text(label, about_text)
 
 def main():
+    logging.basicConfig(level=logging.WARNING)
     print("Available ports:")
     ports = serial.tools.list_ports.comports()
     for i, port in enumerate(ports, start=1):
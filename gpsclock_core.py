@@ -0,0 +1,225 @@
+"""
+Shared core for the GPS LED Clock applications
+
+Holds everything the clock scripts have in common: reading NMEA sentences from the serial port,
+turning RMC fixes into local time, time zone selection and config.ini handling.
+GPS-CLOCK.py and GPS-CLOCK2.py subclass LEDClockBase and only add their own widgets.
+
+Dependencies:
+- serial_asyncio (pyserial-asyncio) for non-blocking serial reads
+- gpsclock_nmea for turning RMC sentences into UTC datetimes
+- zoneinfo for timezone handling
+"""
+
+import tkinter as tk
+import serial
+import serial.tools.list_ports
+from zoneinfo import ZoneInfo
+import configparser
+import asyncio
+import threading
+import queue
+import logging
+import serial_asyncio
+from gpsclock_nmea import parse_rmc
+
+log = logging.getLogger(__name__)
+
+# Queued in place of a fix once the serial connection is gone
+_NO_GPS = object()
+
+class LineProtocol(asyncio.Protocol):
+    def __init__(self, lines):
+        self.lines = lines
+        self.buffer = bytearray()
+
+    def data_received(self, data):
+        self.buffer.extend(data)
+        if b'\n' not in data:
+            return
+        *complete, self.buffer = self.buffer.split(b'\n')
+        for line in complete:
+            self.lines.put_nowait(line.decode('ascii', 'ignore').rstrip())
+
+    def connection_lost(self, exc):
+        log.warning("serial connection lost: %s", exc or "port closed")
+        # Wake read_serial so it can stop instead of waiting forever
+        self.lines.put_nowait(None)
+
+class LEDClockBase(tk.Frame):
+    """Serial, time zone and config handling shared by the clock windows.
+
+    Subclasses set TIME_ZONES, lay out self.time_label (grid or pack) in create_widgets,
+    and override render_time and show_no_gps to draw anything besides the digital label.
+    """
+    TIME_ZONES = ['UTC']
+
+    def __init__(self, master=None, port=None, baudrate=9600):
+        super().__init__(master)
+        self.master = master
+        self.port = port
+        self.baudrate = baudrate
+        self._last_key = None
+        self._last_dt = None
+        self._cached_ord = -1
+        self._cached_date = ''
+        self._save_after_id = None
+        self.load_config()
+        self.configure_gui()
+        self.create_widgets()
+        self.create_menu()
+        self.master.protocol("WM_DELETE_WINDOW", self._on_close)
+        self.start_serial()
+
+    def load_config(self):
+        self.config = configparser.ConfigParser()
+        self.config.read('config.ini')
+        self.selected_time_zone = self.config.get('Settings', 'TimeZone', fallback='UTC')
+        self._tz = ZoneInfo(self.selected_time_zone)
+
+    def save_config(self):
+        self._save_after_id = None
+        if not self.config.has_section('Settings'):
+            self.config.add_section('Settings')
+        self.config.set('Settings', 'TimeZone', self.selected_time_zone)
+        with open('config.ini', 'w') as configfile:
+            self.config.write(configfile)
+
+    def configure_gui(self):
+        self.master.title("GPS LED Clock")
+        self.master.configure(background='black')
+
+    def create_widgets(self):
+        self.time_label = tk.Label(self, font=("Courier", 48, "bold"), fg="#00FF00", bg="black")
+
+    def create_menu(self):
+        self.menu_bar = tk.Menu(self.master)
+        self.master.config(menu=self.menu_bar)
+
+        self.time_zone_menu = tk.Menu(self.menu_bar, tearoff=0)
+        self.menu_bar.add_cascade(label="Time Zone", menu=self.time_zone_menu)
+
+        self._tz_var = tk.StringVar(value=self.selected_time_zone)
+        for tz in self.TIME_ZONES:
+            self.time_zone_menu.add_radiobutton(label=tz, value=tz, variable=self._tz_var, command=self._on_tz_change)
+
+    def _on_tz_change(self):
+        self.set_time_zone(self._tz_var.get())
+
+    def set_time_zone(self, tz):
+        self.selected_time_zone = tz
+        self._tz = ZoneInfo(tz)
+        # Collapse rapid menu changes into a single write
+        if self._save_after_id is not None:
+            self.master.after_cancel(self._save_after_id)
+        self._save_after_id = self.master.after(2000, self.save_config)
+
+    def _on_close(self):
+        if self._save_after_id is not None:
+            self.master.after_cancel(self._save_after_id)
+            self.save_config()
+        self.master.destroy()
+
+    def start_serial(self):
+        self._q = queue.Queue(maxsize=4)
+        self.loop = asyncio.new_event_loop()
+        threading.Thread(target=self.loop.run_forever, daemon=True).start()
+        asyncio.run_coroutine_threadsafe(self.open_serial(), self.loop).result()
+        self._pump()
+
+    async def open_serial(self):
+        lines = asyncio.Queue()
+        await serial_asyncio.create_serial_connection(
+            self.loop, lambda: LineProtocol(lines), self.port, self.baudrate)
+        self.loop.create_task(self.read_serial(lines))
+
+    async def read_serial(self, lines):
+        while True:
+            line = await lines.get()
+            if line is None:
+                log.error("stopped reading GPS data from %s", self.port)
+                self._hand_off(_NO_GPS)
+                return
+            # Only RMC carries both date and time; skip other sentences before parsing
+            if len(line) < 7 or line[3:6] != 'RMC':
+                continue
+            # parse_rmc returns None for malformed sentences, so anything raised here is a bug;
+            # report it without letting one sentence end the reader task
+            try:
+                utc_time = parse_rmc(line)
+            except Exception:
+                log.warning("unexpected error parsing: %s", line, exc_info=True)
+                continue
+            if utc_time is None:
+                log.debug("no usable fix in: %s", line)
+                continue
+            self._hand_off(utc_time.astimezone(self._tz))
+
+    def _hand_off(self, item):
+        # Tk is not thread-safe; hand the item to _pump on the main thread.
+        # _pump only shows the newest item, so when the display falls behind
+        # drop the oldest queued one rather than the one that just arrived.
+        while True:
+            try:
+                self._q.put_nowait(item)
+                break
+            except queue.Full:
+                try:
+                    stale = self._q.get_nowait()
+                    log.debug("display is behind, dropping fix %s", stale)
+                except queue.Empty:
+                    pass
+
+    def _pump(self):
+        item = None
+        while True:
+            try:
+                item = self._q.get_nowait()
+            except queue.Empty:
+                break
+        if item is _NO_GPS:
+            self.show_no_gps()
+        elif item is not None:
+            self.update_time(item)
+        self.master.after(100, self._pump)
+
+    def update_time(self, datetime_obj):
+        # RMC can arrive several times a second; only redraw when the displayed second changes
+        key = (self.selected_time_zone, int(datetime_obj.timestamp()))
+        if key == self._last_key:
+            return
+        self._last_key = key
+        self._last_dt = datetime_obj
+        self.render_time(datetime_obj)
+
+    def render_time(self, datetime_obj):
+        # The date only changes once a day; reuse its formatted string until then
+        ordinal = datetime_obj.toordinal()
+        if ordinal != self._cached_ord:
+            self._cached_date = datetime_obj.strftime('%Y-%m-%d')
+            self._cached_ord = ordinal
+        self.time_label.configure(text=f"{self._cached_date}\n{datetime_obj:%H:%M:%S}")
+
+    def show_no_gps(self):
+        # Blank the last fix so a stopped clock is never mistaken for the current time
+        self._last_key = None
+        self._last_dt = None
+        self.time_label.configure(text="NO GPS\n--:--:--")
+
+    def _render_last(self):
+        # Redraw the most recent fix without waiting for the next sentence
+        if self._last_dt is not None:
+            self.render_time(self._last_dt)
+
+def run(app_class):
+    logging.basicConfig(level=logging.WARNING)
+    print("Available ports:")
+    ports = serial.tools.list_ports.comports()
+    for i, port in enumerate(ports, start=1):
+        print(f"{i}: {port.device}")
+    port_index = int(input("Select the port number: ")) - 1
+    port = ports[port_index].device
+    baudrate = int(input("Enter the baudrate: "))
+    root = tk.Tk()
+    app = app_class(master=root, port=port, baudrate=baudrate)
+    app.mainloop()
@@ -0,0 +1,64 @@
+"""
+RMC sentence parsing for the GPS LED Clock
+
+Turns a raw $xxRMC sentence into a UTC datetime without building a full NMEA message object.
+Kept free of serial and GUI imports so it can be used and tested on its own.
+
+Dependencies:
+- datetime and zoneinfo for the UTC datetime
+- pynmea2 (optional) as a fallback parser for RMC sentences the built-in splitter rejects
+"""
+
+from datetime import date, datetime, time
+from zoneinfo import ZoneInfo
+
+try:
+    import pynmea2
+except ImportError:
+    pynmea2 = None
+
+UTC = ZoneInfo("UTC")
+
+def _checksum_ok(line):
+    body, star, checksum = line.partition('*')
+    if not star:
+        # The checksum is optional in NMEA 0183
+        return True
+    calc = 0
+    for c in body[1:].encode('ascii', 'ignore'):
+        calc ^= c
+    return checksum[:2].upper() == f"{calc:02X}"
+
+def _parse_rmc_pynmea2(line):
+    if pynmea2 is None:
+        return None
+    try:
+        msg = pynmea2.parse(line)
+    except pynmea2.ParseError:
+        return None
+    # pynmea2 hands back the raw string when a field does not convert
+    if msg.status != 'A' or not (isinstance(msg.timestamp, time) and isinstance(msg.datestamp, date)):
+        return None
+    return datetime.combine(msg.datestamp, msg.timestamp, tzinfo=UTC)
+
+def parse_rmc(line):
+    """Return the UTC datetime of a valid RMC sentence, or None if it has no usable fix."""
+    if not _checksum_ok(line):
+        return None
+    # $xxRMC,hhmmss.ss,status,lat,N/S,lon,E/W,speed,course,ddmmyy,...
+    parts = line.split(',', 10)
+    if len(parts) < 10 or parts[2] != 'A':
+        return None
+    hms, dmy = parts[1], parts[9]
+    # int() and float() are lenient (whitespace, 'inf'); insist on the exact field shapes
+    frac = hms[6:]
+    if not (len(dmy) == 6 and dmy.isdigit() and len(hms) >= 6 and hms[:6].isdigit()):
+        return None
+    if frac and not (frac[0] == '.' and frac[1:].isdigit()):
+        return None
+    try:
+        return datetime(2000 + int(dmy[4:6]), int(dmy[2:4]), int(dmy[0:2]),
+                        int(hms[0:2]), int(hms[2:4]), int(hms[4:6]),
+                        int(float(frac or 0) * 1000000), tzinfo=UTC)
+    except ValueError:
+        return _parse_rmc_pynmea2(line)
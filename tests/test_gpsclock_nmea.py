@@ -0,0 +1,89 @@
+import os
+import sys
+import unittest
+from datetime import datetime
+from functools import reduce
+from types import SimpleNamespace
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import gpsclock_nmea
+from gpsclock_nmea import UTC, _checksum_ok, parse_rmc
+
+def with_checksum(body):
+    return f"${body}*{reduce(lambda acc, c: acc ^ c, body.encode('ascii'), 0):02X}"
+
+class ChecksumTest(unittest.TestCase):
+    def test_valid_checksum(self):
+        self.assertTrue(_checksum_ok("$GPRMC,123519,A,4807.038,N,01131.000,E,022.4,084.4,230394,003.1,W*6A"))
+
+    def test_lowercase_checksum(self):
+        self.assertTrue(_checksum_ok("$GPRMC,123519,A,4807.038,N,01131.000,E,022.4,084.4,230394,003.1,W*6a"))
+
+    def test_wrong_checksum(self):
+        self.assertFalse(_checksum_ok("$GPRMC,123519,A,4807.038,N,01131.000,E,022.4,084.4,230394,003.1,W*6B"))
+
+    def test_missing_checksum_is_accepted(self):
+        self.assertTrue(_checksum_ok("$GPRMC,123519,A,4807.038,N,01131.000,E,022.4,084.4,230394,003.1,W"))
+
+class ParseRMCTest(unittest.TestCase):
+    def test_valid_sentence(self):
+        line = "$GPRMC,123519,A,4807.038,N,01131.000,E,022.4,084.4,230324,003.1,W*6A"
+        line = with_checksum(line[1:line.index('*')])
+        self.assertEqual(parse_rmc(line), datetime(2024, 3, 23, 12, 35, 19, tzinfo=UTC))
+
+    def test_wrong_checksum(self):
+        self.assertIsNone(parse_rmc("$GPRMC,123519,A,4807.038,N,01131.000,E,022.4,084.4,230394,003.1,W*6B"))
+
+    def test_void_status(self):
+        self.assertIsNone(parse_rmc(with_checksum("GPRMC,123519,V,,,,,,,230324,,")))
+
+    def test_empty_fields(self):
+        self.assertIsNone(parse_rmc(with_checksum("GPRMC,,A,,,,,,,,,")))
+        self.assertIsNone(parse_rmc(with_checksum("GPRMC,123519,A,,,,,,,,,")))
+
+    def test_too_few_fields(self):
+        self.assertIsNone(parse_rmc(with_checksum("GPRMC,123519,A")))
+
+    def test_truncated_date(self):
+        self.assertIsNone(parse_rmc("$GPRMC,123519,A,4807.038,N,01131.000,E,022.4,084.4,23032"))
+
+    def test_space_padded_date(self):
+        self.assertIsNone(parse_rmc(with_checksum("GPRMC,123519,A,4807.038,N,01131.000,E,022.4,084.4, 30324,003.1,W")))
+
+    def test_short_time(self):
+        self.assertIsNone(parse_rmc(with_checksum("GPRMC,12351,A,4807.038,N,01131.000,E,022.4,084.4,230324,003.1,W")))
+
+    def test_non_numeric_fraction(self):
+        self.assertIsNone(parse_rmc(with_checksum("GPRMC,123519inf,A,4807.038,N,01131.000,E,022.4,084.4,230324,003.1,W")))
+        self.assertIsNone(parse_rmc(with_checksum("GPRMC,123519.5x,A,4807.038,N,01131.000,E,022.4,084.4,230324,003.1,W")))
+
+    def test_fractional_seconds(self):
+        line = with_checksum("GNRMC,001031.50,A,4404.13993,N,12118.86023,W,0.146,,100117,,,A")
+        self.assertEqual(parse_rmc(line), datetime(2017, 1, 10, 0, 10, 31, 500000, tzinfo=UTC))
+
+    def test_fraction_just_below_one_second_is_truncated(self):
+        line = with_checksum("GNRMC,001031.9999996,A,4404.13993,N,12118.86023,W,0.146,,100117,,,A")
+        self.assertEqual(parse_rmc(line), datetime(2017, 1, 10, 0, 10, 31, 999999, tzinfo=UTC))
+
+    def test_leap_second(self):
+        self.assertIsNone(parse_rmc(with_checksum("GPRMC,235960.00,A,4807.038,N,01131.000,E,0.0,,311216,,")))
+
+class PynmeaFallbackTest(unittest.TestCase):
+    def test_unconverted_fields_are_rejected(self):
+        # pynmea2 returns the raw string when a field's converter fails
+        msg = SimpleNamespace(status='A', timestamp='235960.00', datestamp='311216')
+        fake = SimpleNamespace(parse=lambda line: msg, ParseError=ValueError)
+        with mock.patch.object(gpsclock_nmea, 'pynmea2', fake):
+            self.assertIsNone(parse_rmc(with_checksum("GPRMC,235960.00,A,4807.038,N,01131.000,E,0.0,,311216,,")))
+
+    def test_parse_error_is_rejected(self):
+        def parse(line):
+            raise ValueError(line)
+        fake = SimpleNamespace(parse=parse, ParseError=ValueError)
+        with mock.patch.object(gpsclock_nmea, 'pynmea2', fake):
+            self.assertIsNone(parse_rmc(with_checksum("GPRMC,12,A,4807.038,N,01131.000,E,0.0,,311216,,")))
+
+if __name__ == "__main__":
+    unittest.main()